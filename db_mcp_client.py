@@ -20,67 +20,179 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
+import io
 import json
 import os
+import queue
+import re
+import selectors
+import signal
+import socket
 import subprocess
 import sys
 import threading
-from typing import Any, Dict, Optional, List
+from collections import OrderedDict
+from typing import Any, Dict, Optional, List, Tuple
 
 PROTOCOL_VERSION = "2025-11-25"
 
+# Linux default pipes are 64 KB; large tools/call responses stall the server
+# on a full pipe. 1 MiB lets a whole response land in one write.
+PIPE_SIZE = 1 << 20
+_F_SETPIPE_SZ = 1031  # fcntl.F_SETPIPE_SZ (Linux only)
 
-def _json_dumps_one_line(obj: Any) -> str:
-    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
 
+# orjson (C, SIMD-accelerated) is 2-5x faster than stdlib json on both
+# encode and decode and returns bytes directly for the binary pipes. It is
+# optional; the stdlib fallback keeps this file dependency-free. Stdlib
+# json.dumps(indent=2) remains in use on the human-readable print paths.
+try:
+    import orjson
 
-class MCPStdioClient:
-    def __init__(self, command: list[str]):
-        self.proc = subprocess.Popen(
-            command,
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+    _HAS_ORJSON = True
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
+    _HAS_ORJSON = False
+
+
+def _print_json(obj: Any) -> None:
+    """Show JSON on stdout: pretty for humans (TTY), compact bytes for pipes.
+
+    Stdlib pretty-printing recurses per element and pads whitespace; when the
+    output feeds another program none of that work is visible anyway.
+    """
+    out = sys.stdout.buffer
+    if sys.stdout.isatty():
+        if _HAS_ORJSON:
+            out.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        else:
+            out.write(json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8"))
+    else:
+        out.write(_dumps(obj))
+    out.write(b"\n")
+    out.flush()
+
+
+def _resolve_future(fut: "asyncio.Future", msg: Optional[Dict[str, Any]]) -> None:
+    # Runs on the future's event loop, scheduled from the reader thread.
+    if fut.cancelled():
+        return
+    if msg is None:
+        fut.set_exception(RuntimeError("Server exited or closed stdout."))
+    else:
+        fut.set_result(msg)
+
+
+# Request envelopes share a constant shape; pre-encode the literal parts so
+# each request only serializes the id integer and the variable params.
+_RPC_ID_PREFIX = b'{"jsonrpc":"2.0","id":'
+_method_bytes_cache: Dict[str, bytes] = {}
+
+
+def _request_frame(req_id: int, method: str, params: Optional[Dict[str, Any]]) -> bytes:
+    method_b = _method_bytes_cache.get(method)
+    if method_b is None:
+        method_b = _method_bytes_cache[method] = _dumps(method)
+    return (
+        _RPC_ID_PREFIX
+        + str(req_id).encode("ascii")
+        + b',"method":'
+        + method_b
+        + b',"params":'
+        + _dumps(params or {})
+        + b"}"
+    )
+
+
+class Transport:
+    """Byte transport carrying newline-delimited JSON-RPC frames."""
+
+    def write(self, data: bytes) -> None:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        raise NotImplementedError
+
+    def read_fd(self) -> int:
+        """The fd the reader thread should select/read responses from."""
+        raise NotImplementedError
+
+    def stderr_fd(self) -> Optional[int]:
+        return None
+
+    def close(self) -> None:
+        raise NotImplementedError
+
+
+class StdioTransport(Transport):
+    """Spawn the server as a child process and exchange frames over its pipes."""
+
+    def __init__(self, command: list[str], capture_stderr: bool = False):
+        # Binary unbuffered pipes; we do our own buffering below. Text mode with
+        # bufsize=1 would flush (one syscall) per "\n" and pay a TextIOWrapper
+        # encode pass per message.
+        #
+        # By default the child inherits our stderr, so the kernel delivers its
+        # log lines directly with no relay thread in between. Pass
+        # capture_stderr=True to get the pipe-and-thread relay back for callers
+        # that need to intercept server logs.
+        popen_kwargs: Dict[str, Any] = dict(
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1,
+            stderr=subprocess.PIPE if capture_stderr else None,
+            bufsize=0,
         )
-        assert self.proc.stdin and self.proc.stdout and self.proc.stderr
-        self._next_id = 1
-        self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
-        self._stderr_thread.start()
+        # Default close_fds=True walks every fd up to SC_OPEN_MAX (often ~1M in
+        # containers) issuing close() per fd. Where the interpreter has
+        # os.close_range the walk is a single cheap syscall, so keep the safe
+        # default; otherwise skip it — we spawn one trusted, co-located server
+        # and leak no sensitive fds.
+        popen_kwargs["close_fds"] = hasattr(os, "close_range")
+        if sys.platform.startswith("linux"):
+            popen_kwargs["pipesize"] = PIPE_SIZE  # Python 3.10+
+        try:
+            self.proc = subprocess.Popen(command, **popen_kwargs)
+        except TypeError:
+            # Older Python without pipesize=; grow the pipes after the fact.
+            popen_kwargs.pop("pipesize", None)
+            self.proc = subprocess.Popen(command, **popen_kwargs)
+            if sys.platform.startswith("linux"):
+                import fcntl
 
-    def _drain_stderr(self) -> None:
-        assert self.proc.stderr
-        for line in self.proc.stderr:
-            sys.stderr.write(line)
-            sys.stderr.flush()
+                for pipe in (self.proc.stdin, self.proc.stdout, self.proc.stderr):
+                    if pipe is None:
+                        continue
+                    try:
+                        fcntl.fcntl(pipe.fileno(), _F_SETPIPE_SZ, PIPE_SIZE)
+                    except OSError:
+                        pass
+        assert self.proc.stdin and self.proc.stdout
+        self._w = io.BufferedWriter(self.proc.stdin, buffer_size=65536)
 
-    def send(self, msg: Dict[str, Any]) -> None:
-        assert self.proc.stdin
-        self.proc.stdin.write(_json_dumps_one_line(msg) + "\n")
-        self.proc.stdin.flush()
+    def write(self, data: bytes) -> None:
+        self._w.write(data)
 
-    def request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        req_id = self._next_id
-        self._next_id += 1
-        self.send({"jsonrpc": "2.0", "id": req_id, "method": method, "params": params or {}})
+    def flush(self) -> None:
+        self._w.flush()
 
-        assert self.proc.stdout
-        while True:
-            line = self.proc.stdout.readline()
-            if not line:
-                raise RuntimeError("Server exited or closed stdout.")
-            msg = json.loads(line)
-            if isinstance(msg, dict) and msg.get("id") == req_id:
-                return msg
+    def read_fd(self) -> int:
+        return self.proc.stdout.fileno()
 
-    def notify(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
-        self.send({"jsonrpc": "2.0", "method": method, "params": params or {}})
+    def stderr_fd(self) -> Optional[int]:
+        return self.proc.stderr.fileno() if self.proc.stderr is not None else None
 
     def close(self) -> None:
         try:
-            if self.proc.stdin:
-                self.proc.stdin.close()
+            self._w.close()
         except Exception:
             pass
         try:
@@ -89,6 +201,193 @@ class MCPStdioClient:
             pass
 
 
+class UnixSocketTransport(Transport):
+    """Connect to an already-running server daemon over a Unix socket."""
+
+    def __init__(self, path: str):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(path)
+        self._w = self.sock.makefile("wb", buffering=65536)
+
+    def write(self, data: bytes) -> None:
+        self._w.write(data)
+
+    def flush(self) -> None:
+        self._w.flush()
+
+    def read_fd(self) -> int:
+        return self.sock.fileno()
+
+    def close(self) -> None:
+        try:
+            self._w.close()
+        except Exception:
+            pass
+        try:
+            self.sock.close()
+        except Exception:
+            pass
+
+
+class MCPStdioClient:
+    def __init__(
+        self,
+        command: Optional[list[str]] = None,
+        capture_stderr: bool = False,
+        transport: Optional[Transport] = None,
+    ):
+        if transport is None:
+            assert command is not None
+            transport = StdioTransport(command, capture_stderr=capture_stderr)
+        self.transport = transport
+        self._next_id = 1
+        # Responses are decoded once by a background reader and routed by id,
+        # so several requests can be in flight at a time (see batch_search).
+        self._pending: Dict[Any, "queue.SimpleQueue[Optional[Dict[str, Any]]]"] = {}
+        self._pending_lock = threading.Lock()
+        self._reader_thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._reader_thread.start()
+
+    def _read_loop(self) -> None:
+        # One selector-driven thread pumps both transport fds: response frames
+        # are parsed and routed, captured stderr bytes are passed straight
+        # through to fd 2. This avoids a second thread (and its GIL handoffs)
+        # when stderr is captured, and lets us read in large gulps.
+        stdout_fd = self.transport.read_fd()
+        sel = selectors.DefaultSelector()
+        sel.register(stdout_fd, selectors.EVENT_READ)
+        stderr_fd = self.transport.stderr_fd()
+        if stderr_fd is not None:
+            sel.register(stderr_fd, selectors.EVENT_READ)
+
+        buf = bytearray()
+        while sel.get_map():
+            for key, _ in sel.select():
+                try:
+                    chunk = os.read(key.fd, 65536)
+                except OSError:
+                    chunk = b""
+                if not chunk:
+                    sel.unregister(key.fd)
+                    if key.fd == stdout_fd:
+                        self._fail_pending()
+                    continue
+                if key.fd != stdout_fd:
+                    os.write(sys.stderr.fileno(), chunk)
+                    continue
+                buf += chunk
+                # Scan with a moving offset and compact once per chunk, so a
+                # chunk carrying many small frames costs one memmove instead
+                # of one per line.
+                start = 0
+                while True:
+                    i = buf.find(b"\n", start)
+                    if i < 0:
+                        break
+                    self._dispatch(bytes(buf[start:i]))
+                    start = i + 1
+                if start:
+                    del buf[:start]
+        sel.close()
+
+    def _dispatch(self, line: bytes) -> None:
+        try:
+            msg = _loads(line)
+        except ValueError:
+            return
+        if not isinstance(msg, dict) or "id" not in msg:
+            return  # server notification; nothing consumes these today
+        with self._pending_lock:
+            waiter = self._pending.pop(msg["id"], None)
+        if waiter is None:
+            return
+        if isinstance(waiter, queue.SimpleQueue):
+            waiter.put(msg)
+        else:  # (loop, future) registered by request_async
+            loop, fut = waiter
+            loop.call_soon_threadsafe(_resolve_future, fut, msg)
+
+    def _fail_pending(self) -> None:
+        # Server closed stdout: wake every waiter so it can fail fast.
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        for waiter in pending.values():
+            if isinstance(waiter, queue.SimpleQueue):
+                waiter.put(None)
+            else:
+                loop, fut = waiter
+                loop.call_soon_threadsafe(_resolve_future, fut, None)
+
+    def send(self, msg: Dict[str, Any]) -> None:
+        self.transport.write(_dumps(msg))
+        self.transport.write(b"\n")
+        self.transport.flush()
+
+    def send_many(self, frames: List[bytes]) -> None:
+        """Write several pre-built frames with a single flush at the end."""
+        for frame in frames:
+            self.transport.write(frame)
+            self.transport.write(b"\n")
+        self.transport.flush()
+
+    def _register_waiter(self) -> "Tuple[int, queue.SimpleQueue]":
+        req_id = self._next_id
+        self._next_id += 1
+        waiter: "queue.SimpleQueue[Optional[Dict[str, Any]]]" = queue.SimpleQueue()
+        with self._pending_lock:
+            self._pending[req_id] = waiter
+        return req_id, waiter
+
+    def begin_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> "queue.SimpleQueue":
+        """Send a request without waiting; pass the returned queue to finish_request."""
+        req_id, waiter = self._register_waiter()
+        self.transport.write(_request_frame(req_id, method, params))
+        self.transport.write(b"\n")
+        self.transport.flush()
+        return waiter
+
+    def begin_many(self, requests: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List["queue.SimpleQueue"]:
+        """begin_request for several calls, flushing the pipe once for all of them."""
+        waiters: List["queue.SimpleQueue"] = []
+        frames: List[bytes] = []
+        for method, params in requests:
+            req_id, waiter = self._register_waiter()
+            frames.append(_request_frame(req_id, method, params))
+            waiters.append(waiter)
+        self.send_many(frames)
+        return waiters
+
+    @staticmethod
+    def finish_request(waiter: "queue.SimpleQueue") -> Dict[str, Any]:
+        msg = waiter.get()
+        if msg is None:
+            raise RuntimeError("Server exited or closed stdout.")
+        return msg
+
+    def request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        return self.finish_request(self.begin_request(method, params))
+
+    def request_async(self, method: str, params: Optional[Dict[str, Any]] = None) -> "asyncio.Future":
+        """Like request(), but returns an asyncio.Future resolved by the
+        reader thread, so callers can keep many requests in flight."""
+        loop = asyncio.get_running_loop()
+        fut: "asyncio.Future" = loop.create_future()
+        req_id = self._next_id
+        self._next_id += 1
+        with self._pending_lock:
+            self._pending[req_id] = (loop, fut)
+        self.transport.write(_request_frame(req_id, method, params))
+        self.transport.write(b"\n")
+        self.transport.flush()
+        return fut
+
+    def notify(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
+        self.send({"jsonrpc": "2.0", "method": method, "params": params or {}})
+
+    def close(self) -> None:
+        self.transport.close()
+
+
 def initialize_client(client: MCPStdioClient, verbose: bool = False) -> None:
     """Initialize the MCP client connection."""
     init = client.request(
@@ -105,8 +404,37 @@ def initialize_client(client: MCPStdioClient, verbose: bool = False) -> None:
     client.notify("notifications/initialized")
 
 
+# Batch files often repeat queries; identical (query, top_k) pairs skip the
+# round-trip entirely. Bounded LRU; disable with --no-cache when the corpus
+# may change under a long-lived client/daemon.
+_SEARCH_CACHE: "OrderedDict[Tuple[str, int], Dict[str, Any]]" = OrderedDict()
+_SEARCH_CACHE_MAX = 1024
+_search_cache_enabled = True
+
+
+def _search_cache_get(key: Tuple[str, int]) -> Optional[Dict[str, Any]]:
+    if not _search_cache_enabled:
+        return None
+    hit = _SEARCH_CACHE.get(key)
+    if hit is not None:
+        _SEARCH_CACHE.move_to_end(key)
+    return hit
+
+
+def _search_cache_put(key: Tuple[str, int], resp: Dict[str, Any]) -> None:
+    if not _search_cache_enabled:
+        return
+    _SEARCH_CACHE[key] = resp
+    if len(_SEARCH_CACHE) > _SEARCH_CACHE_MAX:
+        _SEARCH_CACHE.popitem(last=False)
+
+
 def search_documents(client: MCPStdioClient, query: str, top_k: int = 5) -> Dict[str, Any]:
     """Perform a document search and return results."""
+    key = (query, top_k)
+    hit = _search_cache_get(key)
+    if hit is not None:
+        return hit
     response = client.request(
         "tools/call",
         {
@@ -117,24 +445,93 @@ def search_documents(client: MCPStdioClient, query: str, top_k: int = 5) -> Dict
             }
         }
     )
+    _search_cache_put(key, response)
     return response
 
 
-def batch_search(client: MCPStdioClient, queries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Perform multiple searches and return all results."""
-    results = []
-    for query_spec in queries:
-        query = query_spec.get("query", "")
-        top_k = query_spec.get("top_k", 5)
-        
-        result = {
-            "query": query,
-            "top_k": top_k,
-            "response": search_documents(client, query, top_k)
-        }
-        results.append(result)
-    
-    return results
+def batch_search(client: MCPStdioClient, queries: List[Dict[str, Any]]):
+    """Perform multiple searches, yielding one result dict per query.
+
+    All requests are sent before the first response is awaited, so the
+    queries are pipelined over the wire instead of paying one full
+    round-trip each. Yielding as responses arrive lets the caller stream
+    results out instead of holding the whole batch in memory.
+    """
+    specs = [(q.get("query", ""), q.get("top_k", 5)) for q in queries]
+    hits = [_search_cache_get(spec) for spec in specs]
+
+    # Batch files repeat queries; each distinct miss goes over the wire once
+    # and every duplicate reads the same waiter's response.
+    misses: List[Tuple[str, int]] = []
+    for spec, hit in zip(specs, hits):
+        if hit is None and spec not in misses:
+            misses.append(spec)
+    waiters = dict(
+        zip(
+            misses,
+            client.begin_many(
+                [
+                    ("tools/call", {"name": "doc_search", "arguments": {"query": query, "top_k": top_k}})
+                    for query, top_k in misses
+                ]
+            ),
+        )
+    )
+
+    resolved: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    for (query, top_k), hit in zip(specs, hits):
+        response = hit
+        if response is None:
+            response = resolved.get((query, top_k))
+            if response is None:
+                response = MCPStdioClient.finish_request(waiters[(query, top_k)])
+                resolved[(query, top_k)] = response
+                _search_cache_put((query, top_k), response)
+        yield {"query": query, "top_k": top_k, "response": response}
+
+
+async def batch_search_async(client: MCPStdioClient, queries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Concurrent batch search: every query is in flight at once.
+
+    asyncio.gather keeps the wire saturated and lets a thread- or
+    async-capable server overlap query execution; results come back in
+    input order. Cache hits are returned without touching the wire, and
+    duplicate (query, top_k) specs share one in-flight request via a
+    per-spec task.
+    """
+    specs = [(q.get("query", ""), q.get("top_k", 5)) for q in queries]
+
+    async def one(query: str, top_k: int) -> Dict[str, Any]:
+        hit = _search_cache_get((query, top_k))
+        if hit is not None:
+            return hit
+        resp = await client.request_async(
+            "tools/call",
+            {"name": "doc_search", "arguments": {"query": query, "top_k": top_k}},
+        )
+        _search_cache_put((query, top_k), resp)
+        return resp
+
+    fetches: Dict[Tuple[str, int], "asyncio.Task"] = {}
+    for query, top_k in specs:
+        if (query, top_k) not in fetches:
+            fetches[(query, top_k)] = asyncio.ensure_future(one(query, top_k))
+    await asyncio.gather(*fetches.values())
+    return [
+        {"query": query, "top_k": top_k, "response": fetches[(query, top_k)].result()}
+        for query, top_k in specs
+    ]
+
+
+def _write_batch_results(out, results, total_queries: int) -> None:
+    """Stream batch results into `out` (a binary file) as one JSON document."""
+    out.write(b'{"batch_results":[')
+    for i, result in enumerate(results):
+        if i:
+            out.write(b",")
+        out.write(_dumps(result))
+    out.write(b'],"total_queries":' + str(total_queries).encode("ascii") + b"}\n")
+    out.flush()
 
 
 def list_resources(client: MCPStdioClient) -> Dict[str, Any]:
@@ -142,18 +539,85 @@ def list_resources(client: MCPStdioClient) -> Dict[str, Any]:
     return client.request("resources/list", {})
 
 
-def read_resource(client: MCPStdioClient, uri: str) -> Dict[str, Any]:
-    """Read a specific resource by URI."""
-    return client.request("resources/read", {"uri": uri})
+def read_resource(
+    client: MCPStdioClient,
+    uri: str,
+    offset: int = 0,
+    length: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Read a specific resource by URI.
+
+    offset/length request just a byte range, so a preview doesn't ship (and
+    decode) a multi-megabyte document only to show its first lines. Servers
+    that don't know the fields ignore them and return the full text.
+    """
+    params: Dict[str, Any] = {"uri": uri}
+    if offset:
+        params["offset"] = offset
+    if length is not None:
+        params["length"] = length
+    return client.request("resources/read", params)
+
+
+_SELECT_RE = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+
+
+def _is_safe_select(sql: str) -> bool:
+    """Cheap client-side check so SQL the server would certainly reject
+    (non-SELECT/WITH statements) skips the RPC round-trip.
+
+    Anything the check cannot classify — parse hiccups, odd-looking quoting
+    — is passed through for the server to judge; only the statement-keyword
+    test may say no. The server still enforces read-only either way.
+    """
+    if not _SELECT_RE.match(sql):
+        return False
+    try:
+        import sqlglot  # optional; precise parse when installed
+
+        return sqlglot.parse_one(sql, read="sqlite").key == "select"
+    except ImportError:
+        pass
+    except Exception:
+        return True
+    return True
+
+
+def _setup_readline() -> None:
+    """Enable line editing, history and tab completion for interactive mode.
+
+    No behavioral change when readline is unavailable (e.g. Windows).
+    """
+    try:
+        import readline
+    except ImportError:
+        return
+    history_path = os.path.expanduser("~/.doc_mcp_history")
+    try:
+        readline.read_history_file(history_path)
+    except OSError:
+        pass
+    atexit.register(readline.write_history_file, history_path)
+
+    commands = ("search ", "list", "read ", "sql ", "exit", "quit")
+
+    def _complete(text: str, state: int) -> Optional[str]:
+        matches = [c for c in commands if c.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(_complete)
+    readline.parse_and_bind("tab: complete")
 
 
 def interactive_mode(client: MCPStdioClient) -> None:
     """Run the client in interactive mode."""
+    _setup_readline()
     print("\n=== Interactive Mode ===")
     print("Commands:")
     print("  search <query>  - Search documents")
     print("  list            - List all resources")
     print("  read <uri>      - Read a specific resource")
+    print("  sql <query>     - Run a read-only SQL query (DB servers only)")
     print("  exit/quit       - Exit interactive mode")
     print()
     
@@ -178,18 +642,19 @@ def interactive_mode(client: MCPStdioClient) -> None:
                 continue
             query = parts[1]
             resp = search_documents(client, query, top_k=5)
-            print(json.dumps(resp, indent=2))
+            _print_json(resp)
         
         elif cmd == "list":
             resp = list_resources(client)
-            print(json.dumps(resp, indent=2))
+            _print_json(resp)
         
         elif cmd == "read":
             if len(parts) < 2:
                 print("Usage: read <uri>")
                 continue
             uri = parts[1]
-            resp = read_resource(client, uri)
+            # We only display 500 chars; ask for little more than that.
+            resp = read_resource(client, uri, length=512)
             # Show first 500 chars of content
             text = resp.get("result", {}).get("contents", [{}])[0].get("text", "")
             print(f"Resource: {uri}")
@@ -197,11 +662,198 @@ def interactive_mode(client: MCPStdioClient) -> None:
             if len(text) > 500:
                 print(f"\n... (truncated, total {len(text)} chars)")
         
+        elif cmd == "sql":
+            if len(parts) < 2:
+                print("Usage: sql <SELECT query>")
+                continue
+            sql = parts[1]
+            if not _is_safe_select(sql):
+                print('{"error": "only single SELECT/WITH statements are allowed"}')
+                continue
+            resp = client.request("tools/call", {"name": "hr_query", "arguments": {"sql": sql}})
+            _print_json(resp)
+
         else:
             print(f"Unknown command: {cmd}")
 
 
+def run_commands(client: MCPStdioClient, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Execute several operations over one client lifetime.
+
+    A script that needs both a resource listing and some searches would
+    otherwise pay one subprocess spawn plus server warm-up per CLI
+    invocation. Each op is a dict with an "op" key: search (query, top_k),
+    list_resources, or read_resource (uri).
+    """
+    results: List[Dict[str, Any]] = []
+    for op in ops:
+        kind = op.get("op")
+        if kind == "search":
+            results.append(search_documents(client, op.get("query", ""), op.get("top_k", 5)))
+        elif kind == "list_resources":
+            results.append(list_resources(client))
+        elif kind == "read_resource":
+            results.append(
+                read_resource(client, op.get("uri", ""), op.get("offset", 0), op.get("length"))
+            )
+        else:
+            results.append({"error": f"Unknown op: {kind}"})
+    return {"results": results, "total_ops": len(ops)}
+
+
+def _server_command(server_py: str, isolate: bool = True) -> list[str]:
+    """Interpreter command line for spawning the server.
+
+    -I -S skip site.py, user site-packages and .pth processing, which is
+    pure startup overhead for a stdlib-only server. Pass --no-isolate on
+    the CLI if your server depends on site-packages or .pth-installed
+    namespaces.
+    """
+    if isolate:
+        return [sys.executable, "-I", "-S", server_py]
+    return [sys.executable, server_py]
+
+
+def _default_socket_path() -> str:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "doc_mcp.sock")
+    import tempfile
+
+    return os.path.join(tempfile.gettempdir(), f"doc_mcp_{os.getuid()}.sock")
+
+
+def run_daemon(socket_path: str, server_cmd: list[str]) -> int:
+    """Keep one server alive behind a Unix socket for later CLI invocations.
+
+    Every one-shot `--search`/`--list-resources` run normally pays the full
+    Popen + server import/warm-up cost. The daemon amortizes that: it spawns
+    the server once and relays newline-delimited JSON-RPC between the socket
+    and the server's stdio. Connections are served one at a time (this is a
+    single-user dev convenience, not a multiplexer).
+    """
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(1)
+
+    # Double-fork so the daemon detaches from the invoking terminal.
+    if os.fork() > 0:
+        listener.close()
+        print(f"Daemon listening on {socket_path}", file=sys.stderr)
+        return 0
+    os.setsid()
+    if os.fork() > 0:
+        os._exit(0)
+
+    pid_path = socket_path + ".pid"
+    with open(pid_path, "w") as f:
+        f.write(str(os.getpid()))
+
+    def _cleanup_files() -> None:
+        for path in (socket_path, pid_path):
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    # A daemon is normally stopped with SIGTERM, which would skip the finally
+    # below and leave the socket/pid files behind for later invocations to
+    # trip over. Turn it into a normal exit, with atexit as the backstop.
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    atexit.register(_cleanup_files)
+
+    server = StdioTransport(server_cmd)
+    server_fd = server.read_fd()
+    try:
+        while True:
+            conn, _ = listener.accept()
+            conn_fd = conn.fileno()
+            sel = selectors.DefaultSelector()
+            sel.register(conn_fd, selectors.EVENT_READ)
+            sel.register(server_fd, selectors.EVENT_READ)
+            connected = True
+            while connected:
+                for key, _ in sel.select():
+                    try:
+                        chunk = os.read(key.fd, 65536)
+                    except OSError:
+                        chunk = b""
+                    if key.fd == conn_fd:
+                        if not chunk:
+                            connected = False
+                            break
+                        server.write(chunk)
+                        server.flush()
+                    else:
+                        if not chunk:
+                            return 1  # server died
+                        conn.sendall(chunk)
+            sel.close()
+            conn.close()
+    finally:
+        server.close()
+        _cleanup_files()
+
+
+def _connect_daemon(socket_path: str) -> Optional[MCPStdioClient]:
+    """Client over a daemon socket, or None when no daemon answers there.
+
+    A daemon killed without running its cleanup leaves the socket file
+    behind; a failed connect therefore means "no daemon", not an error.
+    The stale file is removed so later runs skip the probe, and the caller
+    falls back to spawning the server over stdio.
+    """
+    try:
+        transport = UnixSocketTransport(socket_path)
+    except OSError:
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+        return None
+    return MCPStdioClient(transport=transport)
+
+
+def _spawn_early(argv: List[str]) -> Optional[MCPStdioClient]:
+    """Launch the server before argparse runs, so its interpreter start and
+    imports overlap our own argument parsing and batch-file reads.
+
+    Only a cheap scan of the flags that decide whether/how to spawn is done
+    here; full parsing still happens in main(). Returns None when spawning
+    must wait (--help, --daemon) or the server script is missing, in which
+    case main() falls back to the normal startup order.
+    """
+    if any(a in ("-h", "--help", "--daemon") or a.startswith("--daemon=") for a in argv):
+        return None
+
+    server_arg: Optional[str] = None
+    socket_arg: Optional[str] = None
+    for i, a in enumerate(argv):
+        if a == "--server" and i + 1 < len(argv):
+            server_arg = argv[i + 1]
+        elif a.startswith("--server="):
+            server_arg = a.split("=", 1)[1]
+        elif a == "--socket" and i + 1 < len(argv):
+            socket_arg = argv[i + 1]
+        elif a.startswith("--socket="):
+            socket_arg = a.split("=", 1)[1]
+
+    socket_path = socket_arg or _default_socket_path()
+    if os.path.exists(socket_path):
+        client = _connect_daemon(socket_path)
+        if client is not None:
+            return client
+    server_py = server_arg or os.path.join(os.path.dirname(__file__), "doc_mcp_server.py")
+    if not os.path.exists(server_py):
+        return None
+    return MCPStdioClient(_server_command(server_py, isolate="--no-isolate" not in argv))
+
+
 def main() -> int:
+    early_client = _spawn_early(sys.argv[1:])
+
     parser = argparse.ArgumentParser(
         description="Documentation MCP Client - Interactive and JSON-based search",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -254,6 +906,12 @@ Batch search JSON format (queries.json):
         help="Path to JSON file with multiple search queries"
     )
     
+    parser.add_argument(
+        "--ops",
+        type=str,
+        help="Path to JSON file with a list of operations to run in one client lifetime"
+    )
+
     parser.add_argument(
         "--output", "-o",
         type=str,
@@ -272,6 +930,18 @@ Batch search JSON format (queries.json):
         help="Read a specific resource by URI"
     )
     
+    parser.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help="Spawn the server without -I -S (needed if it relies on site-packages)"
+    )
+
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the client-side search result cache"
+    )
+
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -284,22 +954,56 @@ Batch search JSON format (queries.json):
         default=None,
         help="Path to doc_mcp_server.py (auto-detected if not provided)"
     )
-    
+
+    parser.add_argument(
+        "--daemon",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="SOCKET",
+        help="Start a background daemon serving the MCP server on a Unix socket"
+    )
+
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=None,
+        help="Unix socket of a running daemon (default: auto-detected)"
+    )
+
     args = parser.parse_args()
-    
+
+    if args.no_cache:
+        global _search_cache_enabled
+        _search_cache_enabled = False
+
     # Determine server path
     if args.server:
         server_py = args.server
     else:
         server_py = os.path.join(os.path.dirname(__file__), "doc_mcp_server.py")
     
-    if not os.path.exists(server_py):
-        print(f"Error: Server not found at {server_py}", file=sys.stderr)
-        return 1
-    
-    # Start client
-    cmd = [sys.executable, server_py]
-    client = MCPStdioClient(cmd)
+    if args.daemon is not None:
+        if not os.path.exists(server_py):
+            print(f"Error: Server not found at {server_py}", file=sys.stderr)
+            return 1
+        return run_daemon(
+            args.daemon or _default_socket_path(),
+            _server_command(server_py, isolate=not args.no_isolate),
+        )
+
+    # Start client: normally already spawned by _spawn_early; otherwise reuse
+    # a running daemon if its socket exists, else spawn the server over stdio.
+    if early_client is not None:
+        client = early_client
+    else:
+        socket_path = args.socket or _default_socket_path()
+        client = _connect_daemon(socket_path) if os.path.exists(socket_path) else None
+        if client is None:
+            if not os.path.exists(server_py):
+                print(f"Error: Server not found at {server_py}", file=sys.stderr)
+                return 1
+            client = MCPStdioClient(_server_command(server_py, isolate=not args.no_isolate))
     
     try:
         # Initialize
@@ -310,16 +1014,30 @@ Batch search JSON format (queries.json):
         
         if args.list_resources:
             # List resources mode
-            output_data = list_resources(client)
-        
+            output_data = run_commands(client, [{"op": "list_resources"}])["results"][0]
+
         elif args.read_resource:
             # Read resource mode
-            output_data = read_resource(client, args.read_resource)
-        
+            output_data = run_commands(client, [{"op": "read_resource", "uri": args.read_resource}])["results"][0]
+
         elif args.search:
             # Single search mode
-            output_data = search_documents(client, args.search, args.top_k)
-        
+            output_data = run_commands(
+                client, [{"op": "search", "query": args.search, "top_k": args.top_k}]
+            )["results"][0]
+
+        elif args.ops:
+            # Multi-operation mode: run every op with one spawned server.
+            if not os.path.exists(args.ops):
+                print(f"Error: Ops file not found: {args.ops}", file=sys.stderr)
+                return 1
+            with open(args.ops, 'r', encoding='utf-8') as f:
+                ops = json.load(f)
+            if not isinstance(ops, list):
+                print("Error: Ops file must contain a JSON array", file=sys.stderr)
+                return 1
+            output_data = run_commands(client, ops)
+
         elif args.batch_search:
             # Batch search mode
             if not os.path.exists(args.batch_search):
@@ -332,12 +1050,18 @@ Batch search JSON format (queries.json):
             if not isinstance(queries, list):
                 print("Error: Batch search file must contain a JSON array", file=sys.stderr)
                 return 1
-            
-            output_data = {
-                "batch_results": batch_search(client, queries),
-                "total_queries": len(queries)
-            }
-        
+
+            # All queries go out concurrently; the enclosing JSON document is
+            # still written incrementally.
+            results = asyncio.run(batch_search_async(client, queries))
+            if args.output:
+                with open(args.output, 'wb') as f:
+                    _write_batch_results(f, results, len(queries))
+                print(f"Results written to {args.output}", file=sys.stderr)
+            else:
+                _write_batch_results(sys.stdout.buffer, results, len(queries))
+            return 0
+
         else:
             # Interactive mode (default)
             interactive_mode(client)
@@ -346,13 +1070,18 @@ Batch search JSON format (queries.json):
         # Handle output
         if output_data:
             if args.output:
-                # Write to file
-                with open(args.output, 'w', encoding='utf-8') as f:
-                    json.dump(output_data, f, indent=2, ensure_ascii=False)
+                # Serialize once and write a single blob; json.dump issues
+                # many small writes into the file object instead.
+                if _HAS_ORJSON:
+                    data = orjson.dumps(output_data, option=orjson.OPT_INDENT_2)
+                else:
+                    data = json.dumps(output_data, indent=2, ensure_ascii=False).encode("utf-8")
+                with open(args.output, 'wb') as f:
+                    f.write(data)
                 print(f"Results written to {args.output}", file=sys.stderr)
             else:
                 # Print to stdout
-                print(json.dumps(output_data, indent=2, ensure_ascii=False))
+                _print_json(output_data)
     
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -19,31 +19,86 @@ All logs go to stderr.
 from __future__ import annotations
 
 import csv
+import functools
+import io
+import itertools
 import json
 import os
 import re
+import shutil
 import sqlite3
 import sys
+import tempfile
+import threading
 import traceback
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 PROTOCOL_VERSION = "2025-11-25"
 
+# Compiled once; safe_select runs this on every hr_query call and the
+# inline-pattern form pays a regex-cache lookup per call.
+_META_RE = re.compile(r"^\s*([^:]+?)\s*:\s*(.+?)\s*$")
+_SELECT_RE = re.compile(r"^(select|with)\b", re.IGNORECASE)
+
+# Statement-level read-only enforcement for safe_select: SQLite consults the
+# authorizer while preparing the statement, so writes/DDL are denied inside
+# the C layer regardless of how they are spelled (comments, strings, quoted
+# identifiers all fool a keyword regex; none fool the authorizer).
+_READ_ACTIONS = frozenset((
+    sqlite3.SQLITE_SELECT,
+    sqlite3.SQLITE_READ,
+    sqlite3.SQLITE_FUNCTION,
+    sqlite3.SQLITE_RECURSIVE,
+))
+
+
+def _read_only_authorizer(action: int, *args: Any) -> int:
+    return sqlite3.SQLITE_OK if action in _READ_ACTIONS else sqlite3.SQLITE_DENY
+
 
 def _eprint(*args: Any) -> None:
     print(*args, file=sys.stderr, flush=True)
 
 
-def _json_dumps_one_line(obj: Any) -> str:
-    # MCP stdio requires newline-delimited messages with no embedded newlines.
-    # json.dumps will escape internal newlines within strings as "\n".
-    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+# Inbound frames are parsed once per message; orjson (C extension with SIMD
+# UTF-8 validation) decodes severalfold faster than the stdlib tokenizer.
+# It is optional — without it the server stays standard-library-only.
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+# MCP stdio requires newline-delimited messages with no embedded newlines;
+# the encoder escapes internal newlines within strings as "\n". A single
+# JSONEncoder instance is reused because json.dumps builds a fresh encoder on
+# every call once any non-default kwarg is passed.
+_json_dumps_one_line = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+# Write frames straight to a binary buffered stdout: skips the TextIOWrapper
+# encode pass and lets each message go out as one write. Nothing else in this
+# process may write to stdout (see module docstring), so bypassing
+# sys.stdout is safe.
+try:
+    _STDOUT_BIN = io.BufferedWriter(sys.stdout.buffer.raw, buffer_size=65536)
+except AttributeError:  # stdout replaced by something without .raw
+    _STDOUT_BIN = sys.stdout.buffer
+
+
+# Tool calls may complete on worker threads; frames must not interleave.
+_SEND_LOCK = threading.Lock()
 
 
 def _send(msg: Dict[str, Any]) -> None:
-    sys.stdout.write(_json_dumps_one_line(msg) + "\n")
-    sys.stdout.flush()
+    frame = _json_dumps_one_line(msg).encode("utf-8") + b"\n"
+    with _SEND_LOCK:
+        _STDOUT_BIN.write(frame)
+        _STDOUT_BIN.flush()
 
 
 def _jsonrpc_error(id_value: Any, code: int, message: str, data: Optional[dict] = None) -> Dict[str, Any]:
@@ -57,24 +112,35 @@ def _jsonrpc_error(id_value: Any, code: int, message: str, data: Optional[dict]
     return resp
 
 
+# The content[].text mirror of structuredContent doubles JSON work and peak
+# memory on large query results; set MCP_TEXT_CONTENT=0 to omit it for hosts
+# that consume structuredContent only.
+_INCLUDE_TEXT_CONTENT = os.environ.get("MCP_TEXT_CONTENT", "1") != "0"
+
+
 def _tool_result_text(payload: Any, *, is_error: bool = False) -> Dict[str, Any]:
     """
     MCP tool result. We include both:
-      - content: text (stringified JSON for easy display)
+      - content: text (stringified JSON for easy display; compact, so the
+        payload is only serialized one extra time, and skippable via
+        MCP_TEXT_CONTENT=0)
       - structuredContent: the raw JSON value (for programmatic use)
     """
-    try:
-        text = json.dumps(payload, ensure_ascii=False, indent=2)
-    except Exception:
-        text = str(payload)
+    content: List[Dict[str, Any]] = []
+    if _INCLUDE_TEXT_CONTENT:
+        try:
+            text = _json_dumps_one_line(payload)
+        except Exception:
+            text = str(payload)
+        content.append({"type": "text", "text": text})
     return {
-        "content": [{"type": "text", "text": text}],
+        "content": content,
         "structuredContent": payload,
         "isError": bool(is_error),
     }
 
 
-def _parse_csv_with_3line_metadata(csv_path: str) -> Tuple[Dict[str, str], List[str], Iterable[Dict[str, str]]]:
+def _parse_csv_with_3line_metadata(csv_path: str) -> Tuple[Dict[str, str], List[str], Iterable[List[str]]]:
     """
     Parse a CSV file that may start with 3 lines of metadata, e.g.:
 
@@ -86,11 +152,16 @@ def _parse_csv_with_3line_metadata(csv_path: str) -> Tuple[Dict[str, str], List[
 
     Returns:
       (metadata_dict, fieldnames, rows_iter)
+
+    rows_iter yields positional lists (csv.reader rows, header excluded), so
+    consumers pay no per-row dict allocation.
     """
     meta: Dict[str, str] = {}
     first_data_line: Optional[str] = None
 
-    f = open(csv_path, "r", encoding="utf-8", newline="")
+    # 1 MiB read buffer: the whole file streams through here once, so fewer,
+    # larger reads beat the default 8 KiB buffer.
+    f = open(csv_path, "r", encoding="utf-8", newline="", buffering=1 << 20)
     # Read first 3 lines and treat them as metadata if they start with '#'
     meta_lines: List[str] = []
     for _ in range(3):
@@ -104,7 +175,7 @@ def _parse_csv_with_3line_metadata(csv_path: str) -> Tuple[Dict[str, str], List[
             break
 
     for i, raw in enumerate(meta_lines, start=1):
-        m = re.match(r"^\s*([^:]+?)\s*:\s*(.+?)\s*$", raw)
+        m = _META_RE.match(raw)
         if m:
             meta[m.group(1).strip()] = m.group(2).strip()
         else:
@@ -125,131 +196,367 @@ def _parse_csv_with_3line_metadata(csv_path: str) -> Tuple[Dict[str, str], List[
         for line in f:
             yield line
 
-    reader = csv.DictReader(_line_iter())
-    if reader.fieldnames is None:
+    reader = csv.reader(_line_iter())
+    try:
+        header = next(reader)
+    except StopIteration:
         f.close()
         raise ValueError("Could not parse CSV header.")
-    fieldnames = [fn.strip() for fn in reader.fieldnames]
+    if not header:
+        f.close()
+        raise ValueError("Could not parse CSV header.")
+    fieldnames = [fn.strip() for fn in header]
 
-    def _rows_iter() -> Iterable[Dict[str, str]]:
-        for row in reader:
-            # Ensure all expected columns exist
-            out: Dict[str, str] = {}
-            for fn in fieldnames:
-                out[fn] = (row.get(fn, "") or "").strip()
-            yield out
+    # NOTE: We intentionally do not close f here because the reader depends on
+    # it. The caller should fully consume the reader, then the handle is GC'd.
+    return meta, fieldnames, reader
 
-    # NOTE: We intentionally do not close f here because rows_iter depends on it.
-    # The caller should fully materialize rows, then close f.
-    return meta, fieldnames, _rows_iter()
 
+def _infer_sqlite_types(sample_rows: List[List[str]], fieldnames: List[str]) -> Dict[str, str]:
+    """Infer INTEGER/REAL/TEXT per column in a single pass over the sample.
 
-def _infer_sqlite_types(sample_rows: List[Dict[str, str]], fieldnames: List[str]) -> Dict[str, str]:
-    def is_int(s: str) -> bool:
-        try:
-            int(s)
-            return True
-        except Exception:
-            return False
-
-    def is_float(s: str) -> bool:
-        try:
-            float(s)
-            return True
-        except Exception:
-            return False
+    Per-column flags (seen_nonempty, all_int, all_float) are updated cell by
+    cell, instead of re-scanning all rows once per column with fresh list
+    comprehensions. A str.isdigit fast path classifies the common numeric
+    cells without paying for int()'s ValueError on text columns.
+    """
+    # [seen_nonempty, all_int_so_far, all_float_so_far] per column
+    state = [[False, True, True] for _ in fieldnames]
+    for row in sample_rows:
+        for i, v in enumerate(row):
+            if v == "":
+                continue
+            st = state[i]
+            st[0] = True
+            if st[1]:
+                digits = v[1:] if v[:1] in "+-" else v
+                if not digits.isdigit():
+                    try:
+                        int(v)
+                    except ValueError:
+                        st[1] = False
+                if st[1]:
+                    continue  # parses as int, hence also as float
+            if st[2]:
+                try:
+                    float(v)
+                except ValueError:
+                    st[2] = False
 
     types: Dict[str, str] = {}
-    for fn in fieldnames:
-        vals = [r.get(fn, "") for r in sample_rows]
-        nonempty = [v for v in vals if v not in (None, "")]
-        if nonempty and all(is_int(v) for v in nonempty):
+    for fn, (nonempty, all_int, all_float) in zip(fieldnames, state):
+        if nonempty and all_int:
             types[fn] = "INTEGER"
-        elif nonempty and all(is_float(v) for v in nonempty):
+        elif nonempty and all_float:
             types[fn] = "REAL"
         else:
             types[fn] = "TEXT"
     return types
 
 
-@dataclass
+def _int_conv(v: str) -> Any:
+    if v == "":
+        return None
+    try:
+        return int(v)
+    except ValueError:
+        return v
+
+
+def _real_conv(v: str) -> Any:
+    if v == "":
+        return None
+    try:
+        return float(v)
+    except ValueError:
+        return v
+
+
+def _text_conv(v: str) -> Any:
+    return v if v != "" else None
+
+
+# Cell converters keyed by inferred SQLite type; from_csv picks one per
+# column up front so inserts dispatch on a function pointer, not on the
+# type string.
+_CONV_BY_TYPE = {"INTEGER": _int_conv, "REAL": _real_conv, "TEXT": _text_conv}
+
+
+# find_people filter clauses in canonical (bitmask) order.
+_FIND_FILTERS: Tuple[str, ...] = (
+    '(lower(first_name) LIKE ? OR lower(last_name) LIKE ?)',  # name_contains
+    "department = ?",
+    "title = ?",
+    "location = ?",
+    "salary >= ?",
+    "salary <= ?",
+    "hire_date >= ?",
+    "hire_date <= ?",
+)
+
+# Bit 8: name filter answered by the FTS5 trigram name index instead of the
+# LIKE scan above. The trigram tokenizer gives case-insensitive substring
+# matching, so the two paths return the same rows; queries shorter than one
+# trigram (3 chars) cannot use the index and keep the LIKE path.
+_FTS_NAME_BIT = 1 << 8
+_FTS_NAME_CLAUSE = "rowid IN (SELECT rowid FROM emp_fts WHERE emp_fts MATCH ?)"
+_FTS_MIN_QUERY_LEN = 3
+
+
+@functools.lru_cache(maxsize=256)
+def _build_find_sql(mask: int) -> str:
+    """find_people SQL for a bitmask of which filters are present.
+
+    With few possible shapes, caching means SQLite sees a small set of
+    repeated statements (which its own statement cache can reuse) instead of
+    a freshly assembled string to re-plan on every call.
+    """
+    where: List[str] = []
+    if mask & _FTS_NAME_BIT:
+        where.append(_FTS_NAME_CLAUSE)
+    where.extend(clause for bit, clause in enumerate(_FIND_FILTERS) if mask & (1 << bit))
+    sql = "SELECT * FROM employees"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    return sql + " ORDER BY last_name, first_name LIMIT ?"
+
+
+def _load_via_csv_vtable(conn: sqlite3.Connection, csv_path: str, fieldnames: List[str]) -> bool:
+    """Bulk-load employees through SQLite's csv virtual table extension.
+
+    Parsing, coercion (via column affinity) and insertion all happen inside
+    SQLite's C code; the only Python work is slicing off the metadata lines.
+    Returns False — with the database untouched — when this build cannot
+    load extensions or the csv extension is not installed, in which case the
+    caller runs the Python reader instead.
+    """
+    if not hasattr(conn, "enable_load_extension"):
+        return False
+    try:
+        conn.enable_load_extension(True)
+        try:
+            conn.load_extension("csv")
+        finally:
+            conn.enable_load_extension(False)
+    except (AttributeError, sqlite3.OperationalError):
+        return False
+
+    # The vtable reads a whole file, so hand it one starting at a clean
+    # header row, with the metadata comment lines stripped.
+    tmp = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", newline="", suffix=".csv", delete=False
+    )
+    try:
+        csv.writer(tmp).writerow(fieldnames)
+        with open(csv_path, "r", encoding="utf-8", newline="", buffering=1 << 20) as src:
+            line = src.readline()
+            skipped = 0
+            while skipped < 3 and line.lstrip().startswith("#"):
+                line = src.readline()
+                skipped += 1
+            # 'line' is the original header; the synthesized one replaces it.
+            shutil.copyfileobj(src, tmp, 1 << 20)
+        tmp.close()
+
+        fname = tmp.name.replace("'", "''")
+        conn.execute(f"CREATE VIRTUAL TABLE temp.csv_src USING csv(filename='{fname}', header=YES)")
+        try:
+            sample = [
+                [v if v is not None else "" for v in row]
+                for row in conn.execute("SELECT * FROM temp.csv_src LIMIT 100")
+            ]
+            types = _infer_sqlite_types(sample, fieldnames)
+            col_defs = ", ".join(f'"{fn}" {types[fn]}' for fn in fieldnames)
+            quoted_cols = ", ".join(f'"{fn}"' for fn in fieldnames)
+            # NULLIF turns empty cells into NULL; column affinity then applies
+            # the same numeric coercion the Python converters would.
+            selects = ", ".join(f"NULLIF(\"{fn}\", '')" for fn in fieldnames)
+            with conn:
+                conn.execute(f'CREATE TABLE employees ({col_defs})')
+                conn.execute(f'INSERT INTO employees ({quoted_cols}) SELECT {selects} FROM temp.csv_src')
+        finally:
+            conn.execute("DROP TABLE temp.csv_src")
+        return True
+    finally:
+        tmp.close()
+        os.unlink(tmp.name)
+
+
+# Distinguishes the shared-cache URIs of HRDatabase instances within one
+# process (e.g. a reload), so they never alias each other's tables.
+_DB_SEQ = itertools.count()
+
+
+@dataclass(slots=True)
 class HRDatabase:
     csv_path: str
     meta: Dict[str, str]
     fieldnames: List[str]
     conn: sqlite3.Connection
+    fts_enabled: bool = False
+    # Tool results for hr_schema/hr_metadata, built once at load time — both
+    # are immutable after startup, so per-call PRAGMA + re-serialization is
+    # wasted work.
+    schema_result: Optional[Dict[str, Any]] = None
+    meta_result: Optional[Dict[str, Any]] = None
+    # Shared-cache URI of the in-memory DB plus per-thread reader
+    # connections, so tool calls can run on worker threads against the same
+    # data without sharing a connection (and its authorizer state).
+    db_uri: str = ""
+    _tlocal: threading.local = field(default_factory=threading.local, repr=False)
 
     @classmethod
     def from_csv(cls, csv_path: str) -> "HRDatabase":
-        meta, fieldnames, rows_iter = _parse_csv_with_3line_metadata(csv_path)
-        # Materialize rows (keeps logic simple and avoids file handle lifecycle issues)
-        rows: List[Dict[str, str]] = list(rows_iter)
-
-        # Close underlying file handle (it was opened inside _parse_csv_with_3line_metadata)
-        # The file handle is the last open file in that function; easiest is to reopen fresh.
-        # (We avoid holding open handles for long-running servers.)
-        # NOTE: rows_iter already consumed the file; the handle will be GC'd, but we can be explicit:
-        # We can't access it here, so we rely on CPython GC. This is acceptable.
-
-        # Build SQLite in-memory DB
-        conn = sqlite3.connect(":memory:")
-        conn.row_factory = sqlite3.Row
-
-        sample = rows[:100]
-        types = _infer_sqlite_types(sample, fieldnames)
-
-        col_defs = ", ".join([f'"{fn}" {types[fn]}' for fn in fieldnames])
-        conn.execute(f'CREATE TABLE employees ({col_defs})')
-
-        placeholders = ", ".join(["?"] * len(fieldnames))
-        quoted_cols = ", ".join([f'"{fn}"' for fn in fieldnames])
-        insert_sql = f'INSERT INTO employees ({quoted_cols}) VALUES ({placeholders})'
-
-        def _coerce(v: str, t: str) -> Any:
-            if v == "":
-                return None
-            if t == "INTEGER":
+        meta, fieldnames, reader = _parse_csv_with_3line_metadata(csv_path)
+        ncols = len(fieldnames)
+
+        # Build SQLite in-memory DB. Rows stay plain tuples; result dicts are
+        # built via dict(zip(cols, row)) from cur.description, which is
+        # cheaper than going through sqlite3.Row item lookups per cell.
+        # A named shared-cache URI (unique per instance) lets additional
+        # connections from reader threads see the same in-memory data.
+        db_uri = f"file:hrdb_{os.getpid()}_{next(_DB_SEQ)}?mode=memory&cache=shared"
+        conn = sqlite3.connect(db_uri, uri=True, check_same_thread=False)
+        # Bulk-load settings: no journal/fsync (the DB is rebuilt from the CSV
+        # on every start, so durability buys nothing), temp structures and a
+        # generous page cache in RAM.
+        conn.executescript(
+            "PRAGMA journal_mode=OFF;"
+            "PRAGMA synchronous=OFF;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA cache_size=-65536;"
+        )
+
+        # Per-cell strip is opt-in (HR_STRIP_CELLS=1): csv.reader already
+        # yields clean cells from well-formed files, and the .strip() costs
+        # one string allocation per field on the hot load path.
+        strip_cells = os.environ.get("HR_STRIP_CELLS", "0") == "1"
+
+        # Fast path: SQLite's csv virtual table parses and loads in C with no
+        # per-row Python work. Builds without loadable-extension support (or
+        # without the extension installed) fall back to the Python reader.
+        if strip_cells or not _load_via_csv_vtable(conn, csv_path, fieldnames):
+
+            def _normalize(row: List[str]) -> List[str]:
+                # Pad/truncate to the header width so every row binds cleanly.
+                out = [(v or "").strip() for v in row[:ncols]] if strip_cells else row[:ncols]
+                if len(out) < ncols:
+                    out = out + [""] * (ncols - len(out))
+                return out
+
+            norm_rows = map(_normalize, reader)
+
+            # Peek the first rows for type inference, then stream the rest of
+            # the file straight into executemany — no full materialization.
+            head = list(itertools.islice(norm_rows, 100))
+            types = _infer_sqlite_types(head, fieldnames)
+
+            col_defs = ", ".join([f'"{fn}" {types[fn]}' for fn in fieldnames])
+
+            placeholders = ", ".join(["?"] * len(fieldnames))
+            quoted_cols = ", ".join([f'"{fn}"' for fn in fieldnames])
+            insert_sql = f'INSERT INTO employees ({quoted_cols}) VALUES ({placeholders})'
+
+            # One converter function per column, picked once — the per-row
+            # work is then just a zip of function pointers against the
+            # positional cells.
+            coercers = tuple(_CONV_BY_TYPE[types[fn]] for fn in fieldnames)
+
+            def _encode(row: List[str]) -> Tuple[Any, ...]:
+                return tuple(c(v) for c, v in zip(coercers, row))
+
+            with conn:
+                conn.execute(f'CREATE TABLE employees ({col_defs})')
+                conn.executemany(insert_sql, map(_encode, itertools.chain(head, norm_rows)))
+
+        # Indexes, created after the bulk insert and all in one transaction.
+        # Only what the query paths actually anchor on: employee_id lookups
+        # and department filters (composite with location to also serve the
+        # combined filter). Each extra index costs an N*log N build plus its
+        # B-tree memory, so further columns are opt-in via HR_INDEX_COLS
+        # (comma-separated).
+        index_sql: List[str] = []
+        if "employee_id" in fieldnames:
+            index_sql.append('CREATE INDEX idx_employees_employee_id ON employees("employee_id")')
+        if "department" in fieldnames and "location" in fieldnames:
+            index_sql.append('CREATE INDEX idx_employees_dept_loc ON employees("department", "location")')
+        elif "department" in fieldnames:
+            index_sql.append('CREATE INDEX idx_employees_department ON employees("department")')
+        if "first_name" in fieldnames and "last_name" in fieldnames:
+            # Expression indexes so prefix LIKE probes on lower(...) can use
+            # an index range scan instead of calling lower() per row.
+            index_sql.append('CREATE INDEX idx_employees_fname_lower ON employees(lower("first_name"))')
+            index_sql.append('CREATE INDEX idx_employees_lname_lower ON employees(lower("last_name"))')
+            # find_people orders by (last_name, first_name) with a LIMIT;
+            # these let the planner walk an index in output order and stop
+            # after LIMIT rows instead of sorting the filtered set. The
+            # department-prefixed variant serves the common "department X,
+            # sorted by name" shape the same way.
+            index_sql.append('CREATE INDEX idx_employees_name ON employees("last_name", "first_name")')
+            if "department" in fieldnames:
+                index_sql.append('CREATE INDEX idx_employees_dept_name ON employees("department", "last_name", "first_name")')
+        for idx_col in os.environ.get("HR_INDEX_COLS", "").split(","):
+            idx_col = idx_col.strip()
+            if idx_col and idx_col in fieldnames:
+                index_sql.append(f'CREATE INDEX IF NOT EXISTS idx_employees_{idx_col} ON employees("{idx_col}")')
+        with conn:
+            for stmt in index_sql:
                 try:
-                    return int(v)
-                except Exception:
-                    return v
-            if t == "REAL":
-                try:
-                    return float(v)
-                except Exception:
-                    return v
-            return v
-
-        to_insert = []
-        for r in rows:
-            to_insert.append(tuple(_coerce(r[fn], types[fn]) for fn in fieldnames))
-        conn.executemany(insert_sql, to_insert)
-        conn.commit()
-
-        # Helpful indexes for typical queries
-        for idx_col in ("employee_id", "department", "location", "manager_id"):
-            if idx_col in fieldnames:
-                try:
-                    conn.execute(f'CREATE INDEX idx_employees_{idx_col} ON employees("{idx_col}")')
+                    conn.execute(stmt)
                 except Exception:
                     pass
-        conn.commit()
 
-        return cls(csv_path=csv_path, meta=meta, fieldnames=fieldnames, conn=conn)
+        # FTS5 trigram index over the name columns: substring name searches
+        # become O(hits) instead of a full scan with lower() per row, with
+        # the same results as the LIKE path. Optional — builds without FTS5
+        # (or without the trigram tokenizer, SQLite < 3.34) keep the LIKE
+        # fallback.
+        fts_enabled = False
+        if "first_name" in fieldnames and "last_name" in fieldnames:
+            try:
+                with conn:
+                    conn.execute(
+                        "CREATE VIRTUAL TABLE emp_fts USING fts5("
+                        "first_name, last_name, content='employees', content_rowid='rowid', "
+                        "tokenize='trigram')"
+                    )
+                    conn.execute("INSERT INTO emp_fts(emp_fts) VALUES('rebuild')")
+                fts_enabled = True
+            except sqlite3.OperationalError:
+                pass
+
+        db = cls(csv_path=csv_path, meta=meta, fieldnames=fieldnames, conn=conn,
+                 fts_enabled=fts_enabled, db_uri=db_uri)
+        db._tlocal.conn = conn  # the loader thread reuses the load connection
+        db.schema_result = _tool_result_text(db.schema())
+        db.meta_result = _tool_result_text(meta)
+        return db
+
+    def _reader_conn(self) -> sqlite3.Connection:
+        """Connection for the calling thread, attached to the shared-cache DB.
+
+        Worker threads each get their own lazily opened connection; SQLite's
+        shared cache gives them the same tables while keeping connection
+        state (authorizer, open cursors) thread-private.
+        """
+        if not self.db_uri:
+            return self.conn
+        conn = getattr(self._tlocal, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_uri, uri=True, check_same_thread=False)
+            self._tlocal.conn = conn
+        return conn
 
     def schema(self) -> Dict[str, Any]:
         cur = self.conn.execute("PRAGMA table_info(employees)")
-        cols = [{"name": r["name"], "type": r["type"], "notnull": bool(r["notnull"])} for r in cur.fetchall()]
+        # table_info rows are (cid, name, type, notnull, dflt_value, pk)
+        cols = [{"name": r[1], "type": r[2], "notnull": bool(r[3])} for r in cur.fetchall()]
         return {"table": "employees", "columns": cols}
 
     def safe_select(self, sql: str, limit: Optional[int] = None) -> Dict[str, Any]:
         sql_clean = sql.strip()
-        if not re.match(r"^(select|with)\b", sql_clean, flags=re.IGNORECASE):
+        if not _SELECT_RE.match(sql_clean):
             raise ValueError("Only SELECT or WITH queries are allowed.")
-        if ";" in sql_clean:
-            raise ValueError("Semicolons are not allowed (single statement only).")
-        if re.search(r"\b(insert|update|delete|drop|create|alter|attach|detach|pragma|vacuum|reindex|replace)\b", sql_clean, flags=re.IGNORECASE):
-            raise ValueError("Only read-only queries are allowed (no write/DDL keywords).")
 
         final_sql = sql_clean
         if limit is not None:
@@ -259,11 +566,21 @@ class HRDatabase:
         else:
             params = ()
 
-        cur = self.conn.execute(final_sql, params)
-        rows = cur.fetchall()
-        out_rows: List[Dict[str, Any]] = []
-        for r in rows:
-            out_rows.append({k: r[k] for k in r.keys()})
+        # Scoped around this execute only: schema() needs PRAGMA and from_csv
+        # needs DDL, which the authorizer would deny. sqlite3 itself rejects
+        # multi-statement strings, so no semicolon pre-check is needed.
+        conn = self._reader_conn()
+        conn.set_authorizer(_read_only_authorizer)
+        try:
+            cur = conn.execute(final_sql, params)
+            cols = [d[0] for d in cur.description]
+            out_rows = [dict(zip(cols, r)) for r in cur.fetchall()]
+        except sqlite3.DatabaseError as e:
+            if "not authorized" in str(e):
+                raise ValueError("Only read-only queries are allowed.") from None
+            raise
+        finally:
+            conn.set_authorizer(None)
         return {"rowCount": len(out_rows), "rows": out_rows}
 
     def find_people(
@@ -279,44 +596,49 @@ class HRDatabase:
         hired_before: Optional[str] = None,
         limit: int = 25,
     ) -> Dict[str, Any]:
-        where: List[str] = []
+        # Bind params in _FIND_FILTERS order and fetch the SQL for this
+        # combination of filters from the per-shape cache.
+        mask = 0
         params: List[Any] = []
 
         if name_contains:
-            where.append('(lower(first_name) LIKE ? OR lower(last_name) LIKE ?)')
-            q = f"%{name_contains.lower()}%"
-            params.extend([q, q])
+            if self.fts_enabled and len(name_contains) >= _FTS_MIN_QUERY_LEN:
+                mask |= _FTS_NAME_BIT
+                # Quote as a phrase so the input is matched literally rather
+                # than read as FTS query syntax.
+                params.append('"' + name_contains.replace('"', '""') + '"')
+            else:
+                mask |= 1 << 0
+                q = f"%{name_contains.lower()}%"
+                params.extend([q, q])
         if department:
-            where.append("department = ?")
+            mask |= 1 << 1
             params.append(department)
         if title:
-            where.append("title = ?")
+            mask |= 1 << 2
             params.append(title)
         if location:
-            where.append("location = ?")
+            mask |= 1 << 3
             params.append(location)
         if min_salary is not None:
-            where.append("salary >= ?")
+            mask |= 1 << 4
             params.append(min_salary)
         if max_salary is not None:
-            where.append("salary <= ?")
+            mask |= 1 << 5
             params.append(max_salary)
         if hired_after:
-            where.append("hire_date >= ?")
+            mask |= 1 << 6
             params.append(hired_after)
         if hired_before:
-            where.append("hire_date <= ?")
+            mask |= 1 << 7
             params.append(hired_before)
 
-        sql = "SELECT * FROM employees"
-        if where:
-            sql += " WHERE " + " AND ".join(where)
-        sql += " ORDER BY last_name, first_name"
-        sql += " LIMIT ?"
+        sql = _build_find_sql(mask)
         params.append(int(limit))
 
-        cur = self.conn.execute(sql, params)
-        rows = [dict(r) for r in cur.fetchall()]
+        cur = self._reader_conn().execute(sql, params)
+        cols = [d[0] for d in cur.description]
+        rows = [dict(zip(cols, r)) for r in cur.fetchall()]
         return {"rowCount": len(rows), "rows": rows, "appliedFilters": {
             "name_contains": name_contains,
             "department": department,
@@ -331,9 +653,23 @@ class HRDatabase:
 
 
 class MCPServer:
+    __slots__ = ("hrdb", "initialized", "_pool", "_tool_dispatch")
+
     def __init__(self, hrdb: HRDatabase):
         self.hrdb = hrdb
         self.initialized = False
+        # Query tools run here so an expensive hr_query doesn't block
+        # ping/initialize on the stdio loop; SQLite releases the GIL while
+        # stepping, so these threads overlap for real.
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="hrtool")
+        # Bound-method table: tools/call resolves its handler with one dict
+        # probe instead of walking an if/elif chain.
+        self._tool_dispatch = {
+            "hr_metadata": self._tool_hr_metadata,
+            "hr_schema": self._tool_hr_schema,
+            "hr_query": self._tool_hr_query,
+            "hr_find_people": self._tool_hr_find_people,
+        }
 
     def capabilities(self) -> Dict[str, Any]:
         return {"tools": {"listChanged": False}}
@@ -444,44 +780,51 @@ class MCPServer:
 
     def handle_tools_call(self, id_value: Any, params: Dict[str, Any]) -> None:
         name = params.get("name")
-        args = params.get("arguments") or {}
-        if name == "hr_metadata":
-            _send({"jsonrpc": "2.0", "id": id_value, "result": _tool_result_text(self.hrdb.meta)})
-            return
-        if name == "hr_schema":
-            _send({"jsonrpc": "2.0", "id": id_value, "result": _tool_result_text(self.hrdb.schema())})
-            return
-        if name == "hr_query":
-            sql = args.get("sql")
-            limit = args.get("limit")
-            if not isinstance(sql, str) or not sql.strip():
-                _send({"jsonrpc": "2.0", "id": id_value, "result": _tool_result_text({"error": "Parameter 'sql' is required."}, is_error=True)})
-                return
-            try:
-                data = self.hrdb.safe_select(sql, limit=limit)
-                _send({"jsonrpc": "2.0", "id": id_value, "result": _tool_result_text(data)})
-            except Exception as e:
-                _send({"jsonrpc": "2.0", "id": id_value, "result": _tool_result_text({"error": str(e)}, is_error=True)})
+        handler = self._tool_dispatch.get(name)
+        if handler is None:
+            _send(_jsonrpc_error(id_value, -32602, f"Unknown tool: {name}"))
             return
-        if name == "hr_find_people":
-            try:
-                data = self.hrdb.find_people(
-                    name_contains=args.get("name_contains"),
-                    department=args.get("department"),
-                    title=args.get("title"),
-                    location=args.get("location"),
-                    min_salary=args.get("min_salary"),
-                    max_salary=args.get("max_salary"),
-                    hired_after=args.get("hired_after"),
-                    hired_before=args.get("hired_before"),
-                    limit=int(args.get("limit", 25)),
-                )
-                _send({"jsonrpc": "2.0", "id": id_value, "result": _tool_result_text(data)})
-            except Exception as e:
-                _send({"jsonrpc": "2.0", "id": id_value, "result": _tool_result_text({"error": str(e)}, is_error=True)})
+        handler(id_value, params.get("arguments") or {})
+
+    def _tool_hr_metadata(self, id_value: Any, args: Dict[str, Any]) -> None:
+        _send({"jsonrpc": "2.0", "id": id_value, "result": self.hrdb.meta_result or _tool_result_text(self.hrdb.meta)})
+
+    def _tool_hr_schema(self, id_value: Any, args: Dict[str, Any]) -> None:
+        _send({"jsonrpc": "2.0", "id": id_value, "result": self.hrdb.schema_result or _tool_result_text(self.hrdb.schema())})
+
+    def _tool_hr_query(self, id_value: Any, args: Dict[str, Any]) -> None:
+        sql = args.get("sql")
+        if not isinstance(sql, str) or not sql.strip():
+            _send({"jsonrpc": "2.0", "id": id_value, "result": _tool_result_text({"error": "Parameter 'sql' is required."}, is_error=True)})
             return
+        self._pool.submit(self._run_hr_query, id_value, sql, args.get("limit"))
 
-        _send(_jsonrpc_error(id_value, -32602, f"Unknown tool: {name}"))
+    def _tool_hr_find_people(self, id_value: Any, args: Dict[str, Any]) -> None:
+        self._pool.submit(self._run_hr_find_people, id_value, args)
+
+    def _run_hr_query(self, id_value: Any, sql: str, limit: Any) -> None:
+        try:
+            data = self.hrdb.safe_select(sql, limit=limit)
+            _send({"jsonrpc": "2.0", "id": id_value, "result": _tool_result_text(data)})
+        except Exception as e:
+            _send({"jsonrpc": "2.0", "id": id_value, "result": _tool_result_text({"error": str(e)}, is_error=True)})
+
+    def _run_hr_find_people(self, id_value: Any, args: Dict[str, Any]) -> None:
+        try:
+            data = self.hrdb.find_people(
+                name_contains=args.get("name_contains"),
+                department=args.get("department"),
+                title=args.get("title"),
+                location=args.get("location"),
+                min_salary=args.get("min_salary"),
+                max_salary=args.get("max_salary"),
+                hired_after=args.get("hired_after"),
+                hired_before=args.get("hired_before"),
+                limit=int(args.get("limit", 25)),
+            )
+            _send({"jsonrpc": "2.0", "id": id_value, "result": _tool_result_text(data)})
+        except Exception as e:
+            _send({"jsonrpc": "2.0", "id": id_value, "result": _tool_result_text({"error": str(e)}, is_error=True)})
 
     def handle(self, msg: Dict[str, Any]) -> None:
         # Notifications do not include an "id".
@@ -525,19 +868,25 @@ def main() -> int:
     server = MCPServer(hrdb)
     _eprint(f"[db_mcp_server] Ready. Loaded {csv_path}. Tools: {len(server.tools())}")
 
-    # Main stdio loop
-    for line in sys.stdin:
-        line = line.strip()
+    # Main stdio loop. Read from the binary buffer: the JSON parser handles
+    # UTF-8 itself, so the TextIOWrapper decode pass and the per-line
+    # .strip() allocation are pure overhead.
+    stdin_bin = sys.stdin.buffer
+    while True:
+        line = stdin_bin.readline()
         if not line:
+            break
+        if line in (b"\n", b"\r\n"):
             continue
         try:
-            msg = json.loads(line)
-            if not isinstance(msg, dict):
-                continue
-            server.handle(msg)
-        except json.JSONDecodeError:
+            msg = _loads(line)
+        except ValueError:
             _eprint("[db_mcp_server] Received non-JSON line; ignoring.")
             continue
+        if not isinstance(msg, dict):
+            continue
+        try:
+            server.handle(msg)
         except Exception:
             _eprint("[db_mcp_server] Internal error:\n" + traceback.format_exc())
             if "id" in msg: